@@ -5,10 +5,12 @@ Assignment: Library Inventory System - Task 3 & 4
 Description: Main library management system with file persistence
 """
 
+import dbm
 import json
 import os
 from book import Book
 from member import Member
+from store import CachedStore
 
 
 class Library:
@@ -19,29 +21,59 @@ class Library:
         - List of books
         - List of members
         - Borrow/return operations
-        - File persistence (JSON format)
+        - File persistence (JSON format, or a disk-backed store with
+          a bounded in-memory cache when cache_size is given)
     """
     
     # Class-level variable for analytics
     total_transactions = 0
     
-    def __init__(self, data_dir="library_data"):
+    def __init__(self, data_dir="library_data", cache_size=None):
         """
         Initialize the Library system.
         
         Args:
             data_dir (str): Directory to store library data files
+            cache_size (int): If given, keep books and members in a
+                disk-backed store and hold at most this many of each in
+                memory. By default everything is kept in memory.
+        
+        Raises:
+            ValueError: If cache_size is not given but data_dir already
+                holds a disk-backed store
+        
+        Note:
+            Once the disk-backed store exists it is the source of truth.
+            books.json and members.json are only read to seed an empty
+            store and are not updated while cache_size is in use, so the
+            in-memory mode refuses to open a directory with a store
+            rather than load stale JSON.
         """
-        self.books = {}  # Dictionary: ISBN -> Book object
-        self.members = {}  # Dictionary: member_id -> Member object
         self.data_dir = data_dir
         self.books_file = os.path.join(data_dir, "books.json")
         self.members_file = os.path.join(data_dir, "members.json")
+        self.cache_size = cache_size
         
         # Create data directory if it doesn't exist
         if not os.path.exists(data_dir):
             os.makedirs(data_dir)
         
+        books_store = os.path.join(data_dir, "books_store")
+        members_store = os.path.join(data_dir, "members_store")
+        
+        if cache_size is None:
+            if dbm.whichdb(books_store) is not None or \
+                    dbm.whichdb(members_store) is not None:
+                raise ValueError(
+                    f"'{data_dir}' holds a disk-backed store; "
+                    "open it with cache_size set"
+                )
+            self.books = {}  # Dictionary: ISBN -> Book object
+            self.members = {}  # Dictionary: member_id -> Member object
+        else:
+            self.books = CachedStore(books_store, Book, cache_size)
+            self.members = CachedStore(members_store, Member, cache_size)
+        
         # Load existing data
         self.load_data()
     
@@ -155,17 +187,42 @@ class Library:
         return self.members.get(member_id)
     
     def list_all_books(self):
-        """Return a list of all books."""
+        """
+        Return a list of all books.
+        
+        With a disk-backed store this builds every book at once, ignoring
+        the cache limit. Use iter_books() for large catalogs.
+        """
         return list(self.books.values())
     
     def list_all_members(self):
-        """Return a list of all members."""
+        """
+        Return a list of all members.
+        
+        With a disk-backed store this builds every member at once, ignoring
+        the cache limit. Use iter_members() for large member lists.
+        """
         return list(self.members.values())
     
+    def iter_books(self):
+        """Yield all books one at a time."""
+        return iter(self.books.values())
+    
+    def iter_members(self):
+        """Yield all members one at a time."""
+        return iter(self.members.values())
+    
+    def get_total_books_count(self):
+        """Get total number of books in the library."""
+        return len(self.books)
+    
     # ============ FILE PERSISTENCE ============
     
     def save_books(self):
-        """Save all books to JSON file."""
+        """Save all books to JSON file (or flush the disk-backed store)."""
+        if self.cache_size is not None:
+            self.books.flush()
+            return
         try:
             books_data = [book.to_dict() for book in self.books.values()]
             with open(self.books_file, "w") as f:
@@ -187,7 +244,10 @@ class Library:
             print("Starting with empty library...")
     
     def save_members(self):
-        """Save all members to JSON file."""
+        """Save all members to JSON file (or flush the disk-backed store)."""
+        if self.cache_size is not None:
+            self.members.flush()
+            return
         try:
             members_data = [member.to_dict() for member in self.members.values()]
             with open(self.members_file, "w") as f:
@@ -209,9 +269,34 @@ class Library:
             print("Starting with empty members list...")
     
     def load_data(self):
-        """Load all data from files."""
-        self.load_books()
-        self.load_members()
+        """
+        Load all data from files.
+        
+        With a disk-backed store, the JSON files are only read to seed
+        a store that is still empty; after that the store is used.
+        """
+        if self.cache_size is None or len(self.books) == 0:
+            self.load_books()
+        if self.cache_size is None or len(self.members) == 0:
+            self.load_members()
+    
+    def close(self):
+        """Flush and close the disk-backed stores, if any."""
+        if self.cache_size is not None:
+            self.books.close()
+            self.members.close()
+    
+    def get_cache_stats(self):
+        """
+        Get cache statistics for the disk-backed stores.
+        
+        Returns:
+            dict: Stats for "books" and "members", or None when all
+                data is kept in memory
+        """
+        if self.cache_size is None:
+            return None
+        return {"books": self.books.stats(), "members": self.members.stats()}
     
     # ============ ANALYTICS ============
     
@@ -233,13 +318,17 @@ class Library:
         """Get members who currently have borrowed books."""
         return [m for m in self.members.values() if m.get_borrowed_count() > 0]
     
+    def get_members_with_books_count(self):
+        """Get number of members who currently have borrowed books."""
+        return sum(1 for m in self.members.values() if m.get_borrowed_count() > 0)
+    
     def print_analytics_report(self):
         """Print a comprehensive library analytics report."""
         print("\n" + "=" * 60)
         print("LIBRARY ANALYTICS REPORT".center(60))
         print("=" * 60)
         
-        total_books = len(self.books)
+        total_books = self.get_total_books_count()
         borrowed_books = self.get_currently_borrowed_count()
         available_books = total_books - borrowed_books
         active_members = self.get_active_members_count()
@@ -252,7 +341,7 @@ class Library:
         
         print(f"\nMEMBER STATISTICS:")
         print(f"   Total Active Members: {active_members}")
-        print(f"   Members with Borrowed Books: {len(self.get_members_with_books())}")
+        print(f"   Members with Borrowed Books: {self.get_members_with_books_count()}")
         
         print(f"\nMOST BORROWED BOOK:")
         most_borrowed = self.get_most_borrowed_book()
@@ -6,6 +6,7 @@ Description: Interactive console menu for library management system
 """
 
 from library import Library
+import argparse
 import os
 
 
@@ -149,13 +150,13 @@ def return_book_menu(library):
 def view_all_books(library):
     """Display all books in the library."""
     print("\n--- ALL BOOKS IN LIBRARY ---")
-    books = library.list_all_books()
+    total = library.get_total_books_count()
     
-    if not books:
+    if not total:
         print(" No books in the library yet.")
     else:
-        print(f"\nTotal Books: {len(books)}\n")
-        for idx, book in enumerate(books, 1):
+        print(f"\nTotal Books: {total}\n")
+        for idx, book in enumerate(library.iter_books(), 1):
             print(f"{idx}. {book}")
     print()
 
@@ -163,13 +164,13 @@ def view_all_books(library):
 def view_all_members(library):
     """Display all registered members."""
     print("\n--- ALL REGISTERED MEMBERS ---")
-    members = library.list_all_members()
+    total = library.get_active_members_count()
     
-    if not members:
+    if not total:
         print("No members registered yet.")
     else:
-        print(f"\nTotal Members: {len(members)}\n")
-        for idx, member in enumerate(members, 1):
+        print(f"\nTotal Members: {total}\n")
+        for idx, member in enumerate(library.iter_members(), 1):
             print(f"{idx}. {member}")
             borrowed = member.list_books()
             if borrowed:
@@ -177,13 +178,36 @@ def view_all_members(library):
     print()
 
 
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Library Inventory System")
+    parser.add_argument(
+        "--cache-size", type=int, default=None,
+        help="keep data in a disk-backed store and cache at most this "
+             "many books and members in memory"
+    )
+    args = parser.parse_args()
+    if args.cache_size is not None and args.cache_size < 1:
+        parser.error("--cache-size must be at least 1")
+    return args
+
+
 def main():
     """Main function to run the library system."""
+    args = parse_args()
     clear_screen()
     print_welcome()
     
     # Initialize the library system
-    library = Library()
+    try:
+        library = Library(cache_size=args.cache_size)
+    except ValueError as e:
+        print(f"Error: {e}")
+        print("Run again with --cache-size to use the disk-backed store.")
+        return
+    if args.cache_size is not None:
+        print(f"Disk-backed store enabled (cache size: {args.cache_size}).")
+        print("books.json and members.json are not updated in this mode.")
     
     # Main loop
     while True:
@@ -207,6 +231,7 @@ def main():
         elif choice == "8":
             print("\nThank you for using Library Inventory System!")
             print("Data has been saved automatically.\n")
+            library.close()
             break
         else:
             print("Invalid option! Please select 1-8.")
@@ -0,0 +1,246 @@
+"""
+Library Disk-Backed Store
+Author: Vishnu Shankar
+Assignment: Library Inventory System - Task 4
+Description: Disk-backed object store with a bounded LRU cache of hydrated objects
+"""
+
+import copy
+import shelve
+import weakref
+from collections import OrderedDict
+
+
+class CachedStore:
+    """
+    Dictionary-like store that keeps records on disk and only a bounded
+    number of hydrated objects in memory.
+
+    Records are kept in a ``shelve`` file as plain dictionaries (copies of
+    ``to_dict()``). Objects are rebuilt with ``from_dict()`` on a cache miss
+    and kept in an LRU cache of at most ``max_entries`` objects. When an
+    object is evicted, or when ``flush()`` is called, it is written back to
+    disk if it changed since it was loaded.
+
+    Objects outside the cache that a caller still holds (evicted entries
+    and objects yielded by ``values()``) are tracked without being kept
+    alive: ``get()`` returns the same object instead of building a second
+    copy, and changes made to it are written back by ``flush()`` or, at
+    the latest, when the last reference to it is dropped.
+
+    Attributes:
+        max_entries (int): Maximum number of objects held in memory
+        hits (int): Lookups answered from memory
+        misses (int): Lookups that had to read from disk
+        evictions (int): Objects dropped from the cache
+        evicted_writebacks (int): Changed objects written back on eviction
+        flush_writebacks (int): Changed objects written back by ``flush()``
+    """
+
+    def __init__(self, path, factory, max_entries=128):
+        """
+        Open (or create) a disk-backed store.
+
+        Args:
+            path (str): Base filename of the shelve database
+            factory (type): Class providing ``from_dict()`` / ``to_dict()``
+            max_entries (int): Maximum number of cached objects
+
+        Raises:
+            ValueError: If max_entries is less than 1
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.path = path
+        self.factory = factory
+        self.max_entries = max_entries
+        self._shelf = shelve.open(path)
+        self._cache = OrderedDict()  # key -> (object, dict as last stored)
+        self._tracked = {}  # key -> (finalizer for object, dict as last stored)
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.evicted_writebacks = 0
+        self.flush_writebacks = 0
+
+    # ============ CACHE MANAGEMENT ============
+
+    def _write_back(self, key, obj, stored):
+        """
+        Write an object to disk if it differs from its stored record.
+
+        Returns:
+            tuple: (dict now stored, True if it was written)
+        """
+        data = copy.deepcopy(obj.to_dict())
+        if data != stored:
+            self._shelf[key] = data
+            return data, True
+        return stored, False
+
+    def _track(self, key, obj, stored):
+        """Track an object outside the cache until it is collected."""
+        finalizer = weakref.finalize(obj, self._collected, key, obj.__dict__)
+        finalizer.atexit = False
+        self._tracked[key] = (finalizer, stored)
+
+    def _untrack(self, key):
+        """Stop tracking an object, returning its stored dict if tracked."""
+        entry = self._tracked.pop(key, None)
+        if entry is None:
+            return None
+        entry[0].detach()
+        return entry[1]
+
+    def _collected(self, key, state):
+        """Write back a tracked object once the last reference is dropped."""
+        entry = self._tracked.pop(key, None)
+        if entry is None:
+            return
+        obj = self.factory.__new__(self.factory)
+        obj.__dict__.update(state)
+        _, written = self._write_back(key, obj, entry[1])
+        if written:
+            self.evicted_writebacks += 1
+
+    def _tracked_object(self, key):
+        """Return the tracked object for key if it is still alive."""
+        entry = self._tracked.get(key)
+        if entry is None:
+            return None
+        info = entry[0].peek()
+        return info[0] if info is not None else None
+
+    def _insert(self, key, obj, stored):
+        """Insert an object into the cache, evicting the LRU entry if full."""
+        self._untrack(key)
+        self._cache[key] = (obj, stored)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_entries:
+            old_key, (old_obj, old_stored) = self._cache.popitem(last=False)
+            old_stored, written = self._write_back(old_key, old_obj, old_stored)
+            if written:
+                self.evicted_writebacks += 1
+            self.evictions += 1
+            self._track(old_key, old_obj, old_stored)
+
+    def flush(self):
+        """Write every changed object still in use back to disk."""
+        for key, (obj, stored) in self._cache.items():
+            stored, written = self._write_back(key, obj, stored)
+            if written:
+                self.flush_writebacks += 1
+            self._cache[key] = (obj, stored)
+
+        for key, (finalizer, stored) in list(self._tracked.items()):
+            info = finalizer.peek()
+            if info is None:
+                continue
+            stored, written = self._write_back(key, info[0], stored)
+            if written:
+                self.flush_writebacks += 1
+            self._tracked[key] = (finalizer, stored)
+
+        self._shelf.sync()
+
+    def close(self):
+        """Flush pending changes and close the underlying database."""
+        self.flush()
+        self._cache.clear()
+        for key in list(self._tracked):
+            self._untrack(key)
+        self._shelf.close()
+
+    def stats(self):
+        """
+        Return cache statistics.
+
+        Returns:
+            dict: Hit, miss, eviction and write-back counts, cache size
+                and capacity
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "evicted_writebacks": self.evicted_writebacks,
+            "flush_writebacks": self.flush_writebacks,
+            "size": len(self._cache),
+            "capacity": self.max_entries
+        }
+
+    # ============ DICTIONARY INTERFACE ============
+
+    def get(self, key, default=None):
+        """Return the object for key, loading it from disk on a miss."""
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return self._cache[key][0]
+
+        obj = self._tracked_object(key)
+        if obj is not None:
+            self.hits += 1
+            self._insert(key, obj, self._tracked[key][1])
+            return obj
+
+        self.misses += 1
+        if key not in self._shelf:
+            return default
+
+        data = self._shelf[key]
+        obj = self.factory.from_dict(copy.deepcopy(data))
+        self._insert(key, obj, data)
+        return obj
+
+    def __getitem__(self, key):
+        """Return the object for key, raising KeyError if it is missing."""
+        obj = self.get(key)
+        if obj is None:
+            raise KeyError(key)
+        return obj
+
+    def __setitem__(self, key, obj):
+        """Store an object on disk and cache it."""
+        data = copy.deepcopy(obj.to_dict())
+        self._shelf[key] = data
+        self._insert(key, obj, data)
+
+    def __contains__(self, key):
+        """Check whether key exists without hydrating the object."""
+        return key in self._cache or key in self._shelf
+
+    def __len__(self):
+        """Return the number of records in the store."""
+        return len(self._shelf)
+
+    def __iter__(self):
+        """
+        Iterate over all keys in the store.
+
+        Keys are read from the shelf lazily; only the key index kept by
+        the dbm backend itself is held in memory.
+        """
+        return iter(self._shelf)
+
+    def values(self):
+        """
+        Iterate over all objects without filling the cache.
+
+        Objects already in memory are yielded as-is. Other records are
+        hydrated one at a time and tracked like evicted objects, so they
+        are the same objects ``get()`` returns and changes to them are
+        persisted, but the store does not keep them alive.
+        """
+        for key in self:
+            if key in self._cache:
+                yield self._cache[key][0]
+                continue
+            obj = self._tracked_object(key)
+            if obj is None:
+                data = self._shelf[key]
+                obj = self.factory.from_dict(copy.deepcopy(data))
+                self._track(key, obj, data)
+            yield obj
@@ -0,0 +1,255 @@
+"""
+Library Disk-Backed Store Tests
+Author: Vishnu Shankar
+Assignment: Library Inventory System - Task 4
+Description: Tests for the bounded LRU cache over the disk-backed store
+"""
+
+import contextlib
+import gc
+import io
+import os
+import tempfile
+import unittest
+
+from book import Book
+from library import Library
+from store import CachedStore
+
+
+CACHE_SIZE = 2
+
+
+class CachedStoreTest(unittest.TestCase):
+    """Tests for CachedStore on its own."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "books_store")
+        self.store = CachedStore(self.path, Book, CACHE_SIZE)
+        for i in range(10):
+            self.store[f"i{i}"] = Book(f"Title {i}", "Author", f"i{i}")
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_rejects_empty_cache(self):
+        with self.assertRaises(ValueError):
+            CachedStore(os.path.join(self.tmp.name, "other"), Book, 0)
+
+    def test_size_never_exceeds_capacity(self):
+        self.assertLessEqual(self.store.stats()["size"], CACHE_SIZE)
+        for i in range(10):
+            self.store.get(f"i{i}")
+            self.assertLessEqual(self.store.stats()["size"], CACHE_SIZE)
+
+    def test_hits_and_misses(self):
+        store = CachedStore(self.path + "_fresh", Book, CACHE_SIZE)
+        store["a"] = Book("A", "Author", "a")
+        store["b"] = Book("B", "Author", "b")
+        store["c"] = Book("C", "Author", "c")  # evicts "a"
+        gc.collect()
+
+        store.get("c")
+        store.get("b")
+        store.get("a")
+        store.get("missing")
+
+        stats = store.stats()
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["misses"], 2)
+        store.close()
+
+    def test_dirty_eviction_is_written_back(self):
+        self.store.flush()
+        evictions = self.store.stats()["evictions"]
+
+        # i8 and i9 are cached from setUp and are evicted first
+        self.store.get("i0").borrow()   # dirty
+        self.store.get("i1")            # clean
+        self.store.get("i2")            # evicts dirty i0
+        self.store.get("i3")            # evicts clean i1
+
+        stats = self.store.stats()
+        self.assertEqual(stats["evictions"], evictions + 4)
+        self.assertEqual(stats["evicted_writebacks"], 1)
+        self.assertEqual(stats["flush_writebacks"], 0)
+
+        self.store.close()
+        self.store = CachedStore(self.path, Book, CACHE_SIZE)
+        self.assertFalse(self.store.get("i0").available)
+        self.assertTrue(self.store.get("i1").available)
+
+    def test_values_does_not_fill_cache(self):
+        titles = [book.title for book in self.store.values()]
+        self.assertEqual(len(titles), 10)
+        self.assertLessEqual(self.store.stats()["size"], CACHE_SIZE)
+
+
+class LibraryCacheTest(unittest.TestCase):
+    """Tests for Library running on top of the disk-backed store."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.plain_dir = os.path.join(self.tmp.name, "plain")
+        self.cached_dir = os.path.join(self.tmp.name, "cached")
+        self.quiet = contextlib.redirect_stdout(io.StringIO())
+        self.quiet.__enter__()
+
+    def tearDown(self):
+        self.quiet.__exit__(None, None, None)
+        self.tmp.cleanup()
+
+    def populate(self, library):
+        for i in range(10):
+            library.add_book(f"Title {i}", "Author", f"i{i}")
+        for i in range(5):
+            library.register_member(f"Member {i}", f"m{i}")
+
+    def snapshot(self, library):
+        books = {}
+        for i in range(10):
+            book = library.get_book_by_isbn(f"i{i}")
+            books[book.isbn] = book.to_dict()
+        members = {}
+        for i in range(5):
+            member = library.get_member_by_id(f"m{i}")
+            members[member.member_id] = member.to_dict()
+        return books, members
+
+    def assert_bounded(self, library):
+        stats = library.get_cache_stats()
+        self.assertLessEqual(stats["books"]["size"], CACHE_SIZE)
+        self.assertLessEqual(stats["members"]["size"], CACHE_SIZE)
+
+    def test_matches_plain_library(self):
+        plain = Library(self.plain_dir)
+        cached = Library(self.cached_dir, cache_size=CACHE_SIZE)
+        self.populate(plain)
+        self.populate(cached)
+
+        operations = [
+            ("lend", "m0", "i0"),
+            ("lend", "m1", "i1"),
+            ("lend", "m0", "i2"),
+            ("lend", "m2", "i0"),       # already borrowed
+            ("lend", "m9", "i3"),       # unknown member
+            ("lend", "m3", "i99"),      # unknown book
+            ("return", "m0", "i0"),
+            ("return", "m1", "i0"),     # not borrowed by m1
+            ("lend", "m4", "i0"),
+            ("return", "m1", "i1"),
+        ]
+        for action, member_id, isbn in operations:
+            if action == "lend":
+                expected = plain.lend_book(member_id, isbn)
+                actual = cached.lend_book(member_id, isbn)
+            else:
+                expected = plain.take_return(member_id, isbn)
+                actual = cached.take_return(member_id, isbn)
+            self.assertEqual(actual, expected, (action, member_id, isbn))
+            self.assert_bounded(cached)
+
+        self.assertEqual(self.snapshot(cached), self.snapshot(plain))
+        self.assertIsNone(cached.get_book_by_isbn("i99"))
+        self.assertIsNone(cached.get_member_by_id("m99"))
+
+        expected = self.snapshot(plain)
+        plain.close()
+        cached.close()
+
+        plain = Library(self.plain_dir)
+        cached = Library(self.cached_dir, cache_size=CACHE_SIZE)
+        self.assertEqual(self.snapshot(plain), expected)
+        self.assertEqual(self.snapshot(cached), expected)
+        self.assert_bounded(cached)
+        cached.close()
+
+    def test_bulk_operations_stay_bounded(self):
+        cached = Library(self.cached_dir, cache_size=CACHE_SIZE)
+        self.populate(cached)
+        cached.lend_book("m0", "i0")
+
+        self.assertEqual(len(list(cached.iter_books())), 10)
+        self.assertEqual(len(list(cached.iter_members())), 5)
+        self.assertEqual(cached.get_currently_borrowed_count(), 1)
+        self.assertEqual(cached.get_members_with_books_count(), 1)
+        cached.print_analytics_report()
+        self.assert_bounded(cached)
+        cached.close()
+
+    def test_held_object_changed_after_eviction(self):
+        cached = Library(self.cached_dir, cache_size=CACHE_SIZE)
+        self.populate(cached)
+
+        book = cached.get_book_by_isbn("i0")
+        for i in range(1, 4):
+            cached.get_book_by_isbn(f"i{i}")
+        self.assert_bounded(cached)
+
+        book.borrow()
+        self.assertIs(cached.get_book_by_isbn("i0"), book)
+        for i in range(4, 7):
+            cached.get_book_by_isbn(f"i{i}")
+        book.borrow_count += 1
+        cached.close()
+
+        cached = Library(self.cached_dir, cache_size=CACHE_SIZE)
+        reloaded = cached.get_book_by_isbn("i0")
+        self.assertFalse(reloaded.available)
+        self.assertEqual(reloaded.borrow_count, 2)
+        cached.close()
+
+    def test_evicted_object_changed_then_dropped(self):
+        cached = Library(self.cached_dir, cache_size=CACHE_SIZE)
+        self.populate(cached)
+
+        book = cached.get_book_by_isbn("i0")
+        for i in range(1, 4):
+            cached.get_book_by_isbn(f"i{i}")
+        book.borrow()
+        del book
+        gc.collect()
+
+        self.assertFalse(cached.get_book_by_isbn("i0").available)
+        cached.close()
+
+        cached = Library(self.cached_dir, cache_size=CACHE_SIZE)
+        self.assertFalse(cached.get_book_by_isbn("i0").available)
+        cached.close()
+
+    def test_bulk_results_are_live_objects(self):
+        cached = Library(self.cached_dir, cache_size=CACHE_SIZE)
+        self.populate(cached)
+
+        books = {book.isbn: book for book in cached.list_all_books()}
+        self.assertIs(books["i2"], cached.get_book_by_isbn("i2"))
+        self.assert_bounded(cached)
+
+        for book in cached.iter_books():
+            if book.isbn == "i5":
+                book.borrow()
+        for member in cached.iter_members():
+            if member.member_id == "m3":
+                member.name = "Renamed"
+        del books, book, member
+        gc.collect()
+        cached.close()
+
+        cached = Library(self.cached_dir, cache_size=CACHE_SIZE)
+        self.assertFalse(cached.get_book_by_isbn("i5").available)
+        self.assertEqual(cached.get_member_by_id("m3").name, "Renamed")
+        cached.close()
+
+    def test_plain_mode_refuses_existing_store(self):
+        cached = Library(self.cached_dir, cache_size=CACHE_SIZE)
+        self.populate(cached)
+        cached.close()
+
+        with self.assertRaises(ValueError):
+            Library(self.cached_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()